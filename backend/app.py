@@ -1,11 +1,18 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import numpy as np
 import pandas as pd
+import orjson
+import functools
+import itertools
 import json
 import os
 import logging
 from datetime import datetime
-from model import InternshipRecommendationEngine
+from decimal import Decimal
+from model import InternshipRecommendationEngine, MANIFEST_FILENAME
+from filter_index import InternshipFilterIndex
 
 # Configure logging
 logging.basicConfig(
@@ -14,8 +21,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# numpy/pandas scalars from to_dict() and value_counts() serialize natively
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _orjson_default(obj):
+    """Serialize the few types orjson does not handle natively."""
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        # Mixed-dtype (object) arrays are not covered by OPT_SERIALIZE_NUMPY
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _json_bytes(obj) -> bytes:
+    """Encode an object to JSON bytes with the API's orjson settings."""
+    return orjson.dumps(obj, default=_orjson_default, option=ORJSON_OPTIONS)
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that routes jsonify() and request parsing through orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return _json_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_json_bytes(obj), mimetype='application/json')
+
 app = Flask(__name__)
-CORS(app, origins=["http://localhost:5173", "http://127.0.0.1:5173"])
+app.json = OrjsonProvider(app)
+CORS(
+    app,
+    origins=["http://localhost:5173", "http://127.0.0.1:5173"],
+    # NDJSON responses carry pagination in headers the browser must be allowed to read
+    expose_headers=["X-Total-Count", "X-Filtered-Count", "X-Has-More",
+                    "X-Fuzzy-Corrections", "X-Fuzzy-Suggestions"]
+)
 
 # Initialize the enhanced recommendation engine
 engine = InternshipRecommendationEngine()
@@ -23,11 +70,145 @@ engine = InternshipRecommendationEngine()
 # Load internship data on startup with better error handling
 DATA_PATH = os.path.join(os.path.dirname(__file__), 'internships.csv')
 ARTIFACTS_PATH = os.path.join(os.path.dirname(__file__), 'artifacts')
+STUDENTS_PATH = os.path.join(os.path.dirname(__file__), 'students.csv')
+
+# Responses derived from the internships dataframe, which never changes after startup
+_BROWSE_TABLE_25 = []
+_SECTOR_COUNTS = {}
+_LOCATION_COUNTS = {}
+_SECTORS_BYTES = None
+_LOCATIONS_BYTES = None
+_FILTER_INDEX = None
+_ANALYTICS_BYTES = None
+
+# Serialized /api/skills payload and the source-file mtimes it was built from
+_SKILLS_PAYLOAD_BYTES = None
+_SKILLS_MTIME = None
+
+def _source_mtimes(*paths):
+    """Return modification times for cache invalidation (None for missing files)."""
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.path.getmtime(path))
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+def _wants_ndjson():
+    """True when the client prefers line-delimited JSON over a single document."""
+    best = request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson'])
+    return best == 'application/x-ndjson'
+
+def _ndjson_rows(df):
+    """Yield one encoded JSON line per dataframe row."""
+    columns = df.columns.tolist()
+    for row in df.itertuples(index=False, name=None):
+        yield _json_bytes(dict(zip(columns, row))) + b'\n'
+
+def _read_students_column(column):
+    """Read a single column of students.csv with the multithreaded pyarrow parser."""
+    return pd.read_csv(STUDENTS_PATH, engine='pyarrow', usecols=[column])[column]
+
+def _counts_payload(counts, plural):
+    """Build the name/count listing returned by the sectors and locations endpoints."""
+    items_with_counts = [
+        {'name': name, 'count': count}
+        for name, count in sorted(counts.items())
+    ]
+    return {
+        'success': True,
+        'data': {
+            plural: [item['name'] for item in items_with_counts],
+            f'{plural}_with_counts': items_with_counts,
+            f'total_{plural}': len(items_with_counts)
+        }
+    }
+
+def _build_skills_payload():
+    """Count skills across internships and students.csv into the /api/skills payload."""
+    sources = []
+
+    # Process internship skills
+    if engine.internships_df is not None and 'required_skills' in engine.internships_df.columns:
+        sources.append(engine.internships_df['required_skills'])
+
+    # Also process student skills if available
+    if os.path.exists(STUDENTS_PATH):
+        try:
+            sources.append(_read_students_column('skills'))
+        except Exception as e:
+            logger.warning(f"Could not process students.csv: {str(e)}")
+
+    # Split, normalise and count every comma-separated token in one vectorised pass
+    skill_counts = pd.Series(dtype='int64')
+    if sources:
+        tokens = pd.concat(sources, ignore_index=True).dropna().astype(str).str.split(',').explode().str.strip()
+        skill_counts = tokens[tokens != ''].str.title().value_counts()
+
+    # Sort by count (descending) then by name: stable sort over the name-sorted index
+    skill_counts = skill_counts.sort_index(kind='stable').sort_values(ascending=False, kind='stable')
+    skills_with_counts = [
+        {'name': skill, 'count': int(count)}
+        for skill, count in skill_counts.items()
+    ]
+    
+    return {
+        'success': True,
+        'data': {
+            'skills': [item['name'] for item in skills_with_counts],
+            'skills_with_counts': skills_with_counts,
+            'total_skills': len(skills_with_counts),
+            'popular_skills': [item['name'] for item in skills_with_counts[:20]]
+        }
+    }
 
+def _build_analytics(df):
+    """Summarise the internships dataframe, counting each column only once."""
+    company_counts = df['company'].value_counts().to_dict()
+
+    def top(counts, n=10):
+        return dict(itertools.islice(counts.items(), n))
+
+    return {
+        'overview': {
+            'total_internships': len(df),
+            'total_companies': len(company_counts),
+            'total_locations': len(_LOCATION_COUNTS),
+            'total_industries': len(_SECTOR_COUNTS)
+        },
+        'top_companies': top(company_counts),
+        'top_locations': top(_LOCATION_COUNTS),
+        'top_industries': top(_SECTOR_COUNTS),
+        'role_distribution': df.get('role_level', pd.Series()).value_counts().to_dict(),
+        'company_size_distribution': df.get('company_size', pd.Series()).value_counts().to_dict()
+    }
+
+def _precompute_responses():
+    """Cache browse/sector/location/analytics payloads and filter indexes once the engine data is loaded."""
+    global _BROWSE_TABLE_25, _SECTOR_COUNTS, _LOCATION_COUNTS, _SECTORS_BYTES, _LOCATIONS_BYTES
+    global _FILTER_INDEX, _SKILLS_PAYLOAD_BYTES, _SKILLS_MTIME, _ANALYTICS_BYTES
+
+    df = engine.internships_df
+    _BROWSE_TABLE_25 = df.head(25).to_dict('records')
+    _SECTOR_COUNTS = df['industry'].value_counts().to_dict()
+    _LOCATION_COUNTS = df['location'].value_counts().to_dict()
+    _SECTORS_BYTES = _json_bytes(_counts_payload(_SECTOR_COUNTS, 'sectors'))
+    _LOCATIONS_BYTES = _json_bytes(_counts_payload(_LOCATION_COUNTS, 'locations'))
+    _FILTER_INDEX = InternshipFilterIndex(df)
+    _ANALYTICS_BYTES = _json_bytes(_build_analytics(df))
+    _SKILLS_MTIME = _source_mtimes(STUDENTS_PATH, DATA_PATH)
+    _SKILLS_PAYLOAD_BYTES = _json_bytes(_build_skills_payload())
+
+@functools.lru_cache(maxsize=1)
 def initialize_engine():
-    """Initialize the recommendation engine with proper error handling."""
+    """Initialize the recommendation engine with proper error handling.
+
+    Cached so repeated calls (re-imports, worker hooks) reuse the first result.
+    """
     try:
-        if os.path.exists(ARTIFACTS_PATH) and os.listdir(ARTIFACTS_PATH):
+        # A single stat of the manifest instead of listing the whole directory
+        if os.path.isfile(os.path.join(ARTIFACTS_PATH, MANIFEST_FILENAME)):
             logger.info("Loading pre-trained model artifacts...")
             engine.load_artifacts(ARTIFACTS_PATH)
             logger.info("✅ Model artifacts loaded successfully")
@@ -41,6 +222,7 @@ def initialize_engine():
         else:
             logger.error("❌ No data found. Please ensure internships.csv exists.")
             return False
+        _precompute_responses()
         return True
     except Exception as e:
         logger.error(f"❌ Failed to initialize engine: {str(e)}")
@@ -60,8 +242,8 @@ def health_check():
             'engine_status': {
                 'initialized': engine_initialized,
                 'internships_loaded': engine.internships_df is not None,
-                'model_fitted': engine.vec_main is not None,
-                'total_internships': len(engine.internships_df) if engine.internships_df is not None else 0
+                'model_fitted': engine.is_fitted,
+                'total_internships': engine.total_internships
             },
             'version': '2.0',
             'features': [
@@ -93,8 +275,13 @@ def get_recommendations():
         }), 503
 
     try:
-        # Get and validate candidate data
-        candidate_data = request.get_json()
+        # Get and validate candidate data; orjson decodes the raw body directly,
+        # skipping Flask's content-type negotiation
+        body = request.get_data(cache=False)
+        try:
+            candidate_data = orjson.loads(body) if body else None
+        except orjson.JSONDecodeError as e:
+            return jsonify({'error': 'Request body is not valid JSON', 'details': str(e)}), 400
         
         if not candidate_data:
             return jsonify({'error': 'No data provided in request body'}), 400
@@ -124,17 +311,13 @@ def get_recommendations():
             logger.error(f"Recommendation generation failed: {recommendations['error']}")
             return jsonify(recommendations), 400
 
-        # Get browse table with filtering
-        browse_df = engine.internships_df.head(25) if engine.internships_df is not None else pd.DataFrame([])
-        browse_list = browse_df.to_dict('records')
-
         # Enhanced response with analytics
         response_data = {
             'success': True,
             'timestamp': datetime.now().isoformat(),
             'data': {
                 'recommendations': recommendations,
-                'browse_table': browse_list,
+                'browse_table': _BROWSE_TABLE_25,
                 'analytics': {
                     'total_recommendations': len(recommendations),
                     'avg_confidence': round(sum(r.get('confidence_score', 0) for r in recommendations) / len(recommendations), 1) if recommendations else 0,
@@ -178,45 +361,54 @@ def get_all_internships():
         limit = min(int(request.args.get('limit', 50)), 100)  # Cap at 100
         offset = int(request.args.get('offset', 0))
         
-        # Start with all internships
-        filtered_internships = engine.internships_df.copy()
-        
-        # Apply filters with case-insensitive matching
-        if sector:
-            filtered_internships = filtered_internships[
-                filtered_internships['industry'].str.contains(sector, case=False, na=False)
-            ]
-        
-        if location:
-            filtered_internships = filtered_internships[
-                filtered_internships['location'].str.contains(location, case=False, na=False)
-            ]
-            
-        if skills:
-            filtered_internships = filtered_internships[
-                filtered_internships['required_skills'].str.contains(skills, case=False, na=False)
-            ]
-            
-        if company:
-            filtered_internships = filtered_internships[
-                filtered_internships['company'].str.contains(company, case=False, na=False)
-            ]
-        
-        # Apply pagination
-        total_filtered = len(filtered_internships)
-        filtered_internships = filtered_internships.iloc[offset:offset + limit]
+        # Resolve filters against the prebuilt inverted indexes (case-insensitive substring,
+        # with a fuzzy fallback for misspelt sectors, locations and companies)
+        positions, corrections, suggestions = _FILTER_INDEX.filter(
+            sector=sector, location=location, skills=skills, company=company
+        )
         
-        # Convert to list of dictionaries
-        internships_list = filtered_internships.to_dict('records')
+        # Apply pagination, touching only the rows of the requested page
+        if positions is None:
+            total_filtered = engine.total_internships
+            filtered_internships = engine.internships_df.iloc[offset:offset + limit]
+        else:
+            total_filtered = len(positions)
+            filtered_internships = engine.internships_df.iloc[positions[offset:offset + limit]]
+        
+        # Stream records line by line when asked; pagination and fuzzy matching go in the headers
+        if _wants_ndjson():
+            headers = {
+                'X-Total-Count': str(engine.total_internships),
+                'X-Filtered-Count': str(total_filtered),
+                'X-Has-More': str(offset + limit < total_filtered).lower()
+            }
+            if corrections:
+                headers['X-Fuzzy-Corrections'] = json.dumps(corrections)
+            if suggestions:
+                headers['X-Fuzzy-Suggestions'] = json.dumps(suggestions)
+            return Response(
+                _ndjson_rows(filtered_internships),
+                mimetype='application/x-ndjson',
+                headers=headers
+            )
+        
+        # ?format=columns sends one header row plus value rows instead of a dict per record
+        if request.args.get('format') == 'columns':
+            internships = {
+                'columns': filtered_internships.columns.tolist(),
+                'rows': filtered_internships.to_numpy()
+            }
+        else:
+            internships = filtered_internships.to_dict('records')
         
         return jsonify({
             'success': True,
             'data': {
-                'internships': internships_list,
+                'internships': internships,
                 'pagination': {
-                    'total_count': len(engine.internships_df),
+                    'total_count': engine.total_internships,
                     'filtered_count': total_filtered,
-                    'returned_count': len(internships_list),
+                    'returned_count': len(filtered_internships),
                     'offset': offset,
                     'limit': limit,
                     'has_more': offset + limit < total_filtered
@@ -225,7 +417,9 @@ def get_all_internships():
                     'sector': sector or None,
                     'location': location or None,
                     'skills': skills or None,
-                    'company': company or None
+                    'company': company or None,
+                    'fuzzy_corrections': corrections or None,
+                    'fuzzy_suggestions': suggestions or None
                 }
             }
         })
@@ -246,21 +440,7 @@ def get_sectors():
         if engine.internships_df is None:
             return jsonify({'error': 'No internship data available'}), 404
         
-        # Get sectors with counts
-        sector_counts = engine.internships_df['industry'].value_counts().to_dict()
-        sectors_with_counts = [
-            {'name': sector, 'count': count} 
-            for sector, count in sorted(sector_counts.items())
-        ]
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'sectors': [item['name'] for item in sectors_with_counts],
-                'sectors_with_counts': sectors_with_counts,
-                'total_sectors': len(sectors_with_counts)
-            }
-        })
+        return Response(_SECTORS_BYTES, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Get sectors failed: {str(e)}")
@@ -276,21 +456,7 @@ def get_locations():
         if engine.internships_df is None:
             return jsonify({'error': 'No internship data available'}), 404
         
-        # Get locations with counts
-        location_counts = engine.internships_df['location'].value_counts().to_dict()
-        locations_with_counts = [
-            {'name': location, 'count': count} 
-            for location, count in sorted(location_counts.items())
-        ]
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'locations': [item['name'] for item in locations_with_counts],
-                'locations_with_counts': locations_with_counts,
-                'total_locations': len(locations_with_counts)
-            }
-        })
+        return Response(_LOCATIONS_BYTES, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Get locations failed: {str(e)}")
@@ -299,105 +465,74 @@ def get_locations():
 @app.route('/api/skills', methods=['GET'])
 def get_skills():
     """Get all available skills with enhanced processing."""
+    global _SKILLS_PAYLOAD_BYTES, _SKILLS_MTIME
+
     if not engine_initialized:
         return jsonify({'error': 'Engine not initialized'}), 503
 
     try:
-        all_skills = set()
-        skill_counts = {}
-
-        # Process internship skills
-        if engine.internships_df is not None and 'required_skills' in engine.internships_df.columns:
-            for skills_str in engine.internships_df['required_skills'].dropna():
-                skills = [skill.strip().title() for skill in str(skills_str).split(',') if skill.strip()]
-                for skill in skills:
-                    all_skills.add(skill)
-                    skill_counts[skill] = skill_counts.get(skill, 0) + 1
-
-        # Also process student skills if available
-        students_path = os.path.join(os.path.dirname(__file__), 'students.csv')
-        if os.path.exists(students_path):
-            try:
-                sdf = pd.read_csv(students_path)
-                if 'skills' in sdf.columns:
-                    for skills_str in sdf['skills'].dropna():
-                        skills = [skill.strip().title() for skill in str(skills_str).split(',') if skill.strip()]
-                        for skill in skills:
-                            all_skills.add(skill)
-                            skill_counts[skill] = skill_counts.get(skill, 0) + 1
-            except Exception as e:
-                logger.warning(f"Could not process students.csv: {str(e)}")
-
-        # Sort skills by popularity and alphabetically
-        skills_with_counts = [
-            {'name': skill, 'count': skill_counts.get(skill, 0)}
-            for skill in sorted(all_skills)
-        ]
+        # Rebuild only when students.csv or internships.csv changed on disk
+        mtimes = _source_mtimes(STUDENTS_PATH, DATA_PATH)
+        if _SKILLS_PAYLOAD_BYTES is None or mtimes != _SKILLS_MTIME:
+            _SKILLS_PAYLOAD_BYTES = _json_bytes(_build_skills_payload())
+            _SKILLS_MTIME = mtimes
         
-        # Sort by count (descending) then by name
-        skills_with_counts.sort(key=lambda x: (-x['count'], x['name']))
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'skills': [item['name'] for item in skills_with_counts],
-                'skills_with_counts': skills_with_counts,
-                'total_skills': len(skills_with_counts),
-                'popular_skills': [item['name'] for item in skills_with_counts[:20]]
-            }
-        })
+        return Response(_SKILLS_PAYLOAD_BYTES, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Get skills failed: {str(e)}")
         return jsonify({'error': f'Failed to retrieve skills: {str(e)}'}), 500
 
+@functools.lru_cache(maxsize=1)
+def _education_payload_bytes(students_mtime):
+    """Build the encoded education-levels payload; memoized on the students.csv mtime."""
+    # Get from students.csv if available
+    dynamic_levels = []
+    
+    if students_mtime is not None:
+        try:
+            level_counts = _read_students_column('education').value_counts().to_dict()
+            dynamic_levels = [
+                {'name': str(level), 'count': count}
+                for level, count in level_counts.items()
+                if pd.notna(level)
+            ]
+        except Exception as e:
+            logger.warning(f"Could not process students.csv for education levels: {str(e)}")
+    
+    # Fallback to static list with hierarchy
+    static_levels = [
+        '10th', '12th', 'Diploma', 'UG', 'B.Tech', 'B.Sc', 'BBA', 'B.Com', 'BCA',
+        'PG', 'M.Tech', 'M.Sc', 'MBA', 'MCA', 'M.Com', 'PhD'
+    ]
+    
+    # Use dynamic if available, otherwise static
+    if dynamic_levels:
+        # Sort by hierarchy if engine is available
+        if engine_initialized and hasattr(engine, 'education_hierarchy'):
+            dynamic_levels.sort(key=lambda x: engine.education_hierarchy.get(x['name'], 999))
+        levels_data = [item['name'] for item in dynamic_levels]
+        levels_with_counts = dynamic_levels
+    else:
+        levels_data = static_levels
+        levels_with_counts = [{'name': level, 'count': 0} for level in static_levels]
+    
+    return _json_bytes({
+        'success': True,
+        'data': {
+            'education_levels': levels_data,
+            'education_levels_with_counts': levels_with_counts,
+            'hierarchy': engine.education_hierarchy if engine_initialized else {},
+            'total_levels': len(levels_data)
+        }
+    })
+
 @app.route('/api/education-levels', methods=['GET'])
 def get_education_levels():
     """Get all available education levels with hierarchy information."""
     try:
-        # Get from students.csv if available
-        students_path = os.path.join(os.path.dirname(__file__), 'students.csv')
-        dynamic_levels = []
-        
-        if os.path.exists(students_path):
-            try:
-                sdf = pd.read_csv(students_path)
-                if 'education' in sdf.columns:
-                    level_counts = sdf['education'].value_counts().to_dict()
-                    dynamic_levels = [
-                        {'name': str(level), 'count': count}
-                        for level, count in level_counts.items()
-                        if pd.notna(level)
-                    ]
-            except Exception as e:
-                logger.warning(f"Could not process students.csv for education levels: {str(e)}")
-        
-        # Fallback to static list with hierarchy
-        static_levels = [
-            '10th', '12th', 'Diploma', 'UG', 'B.Tech', 'B.Sc', 'BBA', 'B.Com', 'BCA',
-            'PG', 'M.Tech', 'M.Sc', 'MBA', 'MCA', 'M.Com', 'PhD'
-        ]
-        
-        # Use dynamic if available, otherwise static
-        if dynamic_levels:
-            # Sort by hierarchy if engine is available
-            if engine_initialized and hasattr(engine, 'education_hierarchy'):
-                dynamic_levels.sort(key=lambda x: engine.education_hierarchy.get(x['name'], 999))
-            levels_data = [item['name'] for item in dynamic_levels]
-            levels_with_counts = dynamic_levels
-        else:
-            levels_data = static_levels
-            levels_with_counts = [{'name': level, 'count': 0} for level in static_levels]
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'education_levels': levels_data,
-                'education_levels_with_counts': levels_with_counts,
-                'hierarchy': engine.education_hierarchy if engine_initialized else {},
-                'total_levels': len(levels_data)
-            }
-        })
+        students_mtime, = _source_mtimes(STUDENTS_PATH)
+        return Response(_education_payload_bytes(students_mtime), mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Get education levels failed: {str(e)}")
@@ -413,27 +548,10 @@ def get_analytics():
         if engine.internships_df is None:
             return jsonify({'error': 'No data available for analytics'}), 404
 
-        df = engine.internships_df
-        
-        analytics = {
-            'overview': {
-                'total_internships': len(df),
-                'total_companies': df['company'].nunique(),
-                'total_locations': df['location'].nunique(),
-                'total_industries': df['industry'].nunique()
-            },
-            'top_companies': df['company'].value_counts().head(10).to_dict(),
-            'top_locations': df['location'].value_counts().head(10).to_dict(),
-            'top_industries': df['industry'].value_counts().head(10).to_dict(),
-            'role_distribution': df.get('role_level', pd.Series()).value_counts().to_dict(),
-            'company_size_distribution': df.get('company_size', pd.Series()).value_counts().to_dict()
-        }
-        
-        return jsonify({
-            'success': True,
-            'data': analytics,
-            'timestamp': datetime.now().isoformat()
-        })
+        # The data block is pre-encoded at startup; only the timestamp is spliced in per request
+        timestamp = _json_bytes(datetime.now().isoformat())
+        body = b'{"success":true,"data":' + _ANALYTICS_BYTES + b',"timestamp":' + timestamp + b'}'
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Analytics request failed: {str(e)}")
@@ -491,4 +609,5 @@ if __name__ == '__main__':
     print("  • Enhanced error handling and logging")
     print("  • Comprehensive API documentation")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Development server only; use `gunicorn app:app` (see gunicorn.conf.py) in production
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""Inverted indexes backing the /api/internships search filters."""
+import functools
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import process
+
+
+class ColumnIndex:
+    """Posting lists from each distinct (lowercased) column value to its rows.
+
+    A case-insensitive substring query only has to scan the distinct values,
+    which are far fewer than the rows, and then union their posting lists.
+    """
+
+    CACHE_SIZE = 1024
+
+    def __init__(self, column: pd.Series) -> None:
+        codes, uniques = pd.factorize(column.astype(object).fillna("").astype(str).str.lower(), sort=True)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+
+        self.values: List[str] = list(uniques)
+        self.postings: Dict[str, np.ndarray] = {
+            value: order[bounds[i]:bounds[i + 1]]
+            for i, value in enumerate(self.values)
+        }
+        # Repeated queries (pagination, popular filters) skip the scan entirely
+        self._match = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._scan)
+
+    def lookup(self, query: str) -> np.ndarray:
+        """Return the sorted row positions whose value contains ``query``."""
+        return self._match(query.lower())
+
+    def _scan(self, query: str) -> np.ndarray:
+        # Plain substring tests (str.__contains__) over the distinct values: a
+        # linear-time literal search with no regex compilation or backtracking.
+        matches = [self.postings[value] for value in self.values if query in value]
+        if matches:
+            positions = np.sort(np.concatenate(matches))
+        else:
+            positions = np.empty(0, dtype=np.intp)
+        positions.flags.writeable = False  # shared between requests via the cache
+        return positions
+
+    def closest(self, query: str, score_cutoff: float = 75, limit: int = 2) -> List[Tuple[str, float]]:
+        """Return up to ``limit`` distinct values most similar to ``query``, best first."""
+        matches = process.extract(query.lower(), self.values, limit=limit, score_cutoff=score_cutoff)
+        return [(value, score) for value, score, _ in matches]
+
+
+class InternshipFilterIndex:
+    """Filter indexes over the internships dataframe, keyed by query parameter."""
+
+    FILTER_COLUMNS = {
+        "sector": "industry",
+        "location": "location",
+        "skills": "required_skills",
+        "company": "company",
+    }
+    # Free-text filters that fall back to the closest value when nothing matches
+    FUZZY_FILTERS = ("sector", "location", "company")
+    FUZZY_MIN_LENGTH = 4
+    # A near miss is only applied when it scores this high and clearly beats the
+    # runner-up; weaker or ambiguous matches are returned as suggestions instead.
+    # Distinct cities can be one edit apart ("bangalore" vs "mangalore"), so the
+    # bar sits above a single substitution in a word of that length.
+    SUGGESTION_CUTOFF = 75
+    CORRECTION_CUTOFF = 90
+    CORRECTION_MARGIN = 10
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.columns: Dict[str, ColumnIndex] = {
+            name: ColumnIndex(df[column])
+            for name, column in self.FILTER_COLUMNS.items()
+        }
+
+    def filter(self, **queries: Optional[str]) -> Tuple[Optional[np.ndarray], Dict[str, str], Dict[str, str]]:
+        """Return sorted row positions matching every non-empty query.
+
+        Positions are ``None`` when no filter is set so callers can slice the
+        dataframe directly instead of gathering every row position. A sector,
+        location or company query that matches nothing is retried with the
+        closest distinct value when that match is unambiguous (e.g.
+        "hyderbad" -> "hyderabad"); otherwise the query keeps matching nothing
+        and the closest value is only offered as a suggestion. Returns
+        ``(positions, corrections, suggestions)``.
+        """
+        result = None
+        corrections: Dict[str, str] = {}
+        suggestions: Dict[str, str] = {}
+        for name, query in queries.items():
+            if not query:
+                continue
+            index = self.columns[name]
+            positions = index.lookup(query)
+            if (not len(positions) and name in self.FUZZY_FILTERS
+                    and len(query) >= self.FUZZY_MIN_LENGTH):
+                matches = index.closest(query, score_cutoff=self.SUGGESTION_CUTOFF)
+                if matches:
+                    best, score = matches[0]
+                    runner_up = matches[1][1] if len(matches) > 1 else 0.0
+                    if score >= self.CORRECTION_CUTOFF and score - runner_up >= self.CORRECTION_MARGIN:
+                        corrections[name] = best
+                        positions = index.lookup(best)
+                    else:
+                        suggestions[name] = best
+            if result is None:
+                result = positions
+            else:
+                result = np.intersect1d(result, positions, assume_unique=True)
+        return result, corrections, suggestions
@@ -0,0 +1,17 @@
+"""Gunicorn settings for serving the recommendation API in production.
+
+Run from the backend directory with ``gunicorn app:app``; gunicorn picks
+this file up automatically.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "gevent"
+
+# Import app.py (and load or fit the engine) once in the master process so the
+# dataframe and TF-IDF matrices are shared copy-on-write by every worker.
+# Matrices loaded from artifacts are read-only memory maps, so even workers
+# that load on their own (e.g. with preloading disabled) share the page cache.
+preload_app = True
@@ -1,14 +1,226 @@
 import os
 import json
-from typing import List, Dict, Any, Optional, Tuple
+import functools
+from collections import Counter
+from typing import TYPE_CHECKING, List, Dict, Any, FrozenSet, Iterable, NamedTuple, Optional, Tuple
 import re
 
 import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.preprocessing import StandardScaler
-import joblib
+from scipy.sparse import csr_matrix, hstack
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+# Text normalisation shared by internship columns and candidate input
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\+\#\-\.]')
+SKILL_MAPPINGS = {
+    'javascript': 'js', 'python programming': 'python',
+    'machine learning': 'ml', 'artificial intelligence': 'ai',
+    'data science': 'data analysis', 'web development': 'web dev'
+}
+
+
+def _keyword_pattern(words: List[str]) -> str:
+    """Regex alternation matching any of ``words`` as a substring."""
+    return "|".join(re.escape(word) for word in words)
+
+
+# Arrays that make up a CSR matrix, each stored as its own .npy file
+_CSR_PARTS = ("data", "indices", "indptr")
+
+
+def _save_csr(directory: str, matrix) -> None:
+    """Persist a sparse matrix as raw CSR arrays that ``_load_csr`` can memory-map."""
+    os.makedirs(directory, exist_ok=True)
+    matrix = matrix.tocsr()
+    for part in _CSR_PARTS:
+        np.save(os.path.join(directory, f"{part}.npy"), getattr(matrix, part))
+    np.save(os.path.join(directory, "shape.npy"), np.asarray(matrix.shape, dtype=np.int64))
+
+
+def _load_csr(directory: str, mmap_mode: Optional[str] = "r") -> csr_matrix:
+    """Rebuild a CSR matrix directly over the (memory-mapped) arrays in ``directory``.
+
+    With the default read-only mapping the arrays are backed by the page cache,
+    so every worker process that loads the same artifacts shares one physical
+    copy. The matrix must be treated as immutable: in-place updates raise.
+    """
+    data, indices, indptr = (
+        np.load(os.path.join(directory, f"{part}.npy"), mmap_mode=mmap_mode)
+        for part in _CSR_PARTS
+    )
+    shape = tuple(int(n) for n in np.load(os.path.join(directory, "shape.npy")))
+    return csr_matrix((data, indices, indptr), shape=shape, copy=False)
+
+
+class FrozenTfidf:
+    """Inference-only copy of a fitted word-level ``TfidfVectorizer``.
+
+    Holds just the vocabulary, idf weights and analyzer settings and rebuilds
+    ``transform`` from them: lowercase, regex tokenize, drop stop words, word
+    n-grams, term counts (optionally sublinear) times idf, then L2-normalise.
+    For the short candidate texts scored per request this avoids sklearn's
+    generic analyzer pipeline and per-call validation overhead.
+    """
+
+    # Vectorizer settings transform() hard-codes (word analyzer, default
+    # preprocessing, raw counts, idf weighting, L2 norm)
+    _REQUIRED_SETTINGS = {
+        "analyzer": "word",
+        "preprocessor": None,
+        "tokenizer": None,
+        "strip_accents": None,
+        "binary": False,
+        "use_idf": True,
+        "norm": "l2",
+    }
+
+    def __init__(self, vocabulary: Dict[str, int], idf: np.ndarray,
+                 ngram_range: Tuple[int, int] = (1, 1),
+                 stop_words: Optional[Iterable[str]] = None,
+                 sublinear_tf: bool = False,
+                 token_pattern: str = r"(?u)\b\w\w+\b",
+                 lowercase: bool = True) -> None:
+        self.vocabulary = vocabulary
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.ngram_range = tuple(ngram_range)
+        self.stop_words = frozenset(stop_words or ())
+        self.sublinear_tf = sublinear_tf
+        self.token_pattern = token_pattern
+        self.lowercase = lowercase
+        self._tokenize = re.compile(token_pattern).findall
+
+    @classmethod
+    def from_vectorizer(cls, vectorizer: "TfidfVectorizer") -> "FrozenTfidf":
+        """Capture the state of a fitted ``TfidfVectorizer``.
+
+        Raises ``ValueError`` for settings this transform does not reproduce, so
+        candidate vectors can never silently drift from the internship matrix.
+        """
+        unsupported = {
+            name: getattr(vectorizer, name)
+            for name, expected in cls._REQUIRED_SETTINGS.items()
+            if getattr(vectorizer, name) != expected
+        }
+        if unsupported:
+            raise ValueError(f"FrozenTfidf cannot reproduce TfidfVectorizer settings: {unsupported}")
+        return cls(
+            vocabulary=vectorizer.vocabulary_,
+            idf=vectorizer.idf_,
+            ngram_range=vectorizer.ngram_range,
+            stop_words=vectorizer.get_stop_words(),
+            sublinear_tf=vectorizer.sublinear_tf,
+            token_pattern=vectorizer.token_pattern,
+            lowercase=vectorizer.lowercase
+        )
+
+    def save(self, directory: str) -> None:
+        """Write the analyzer settings and vocabulary as JSON and the idf weights as ``.npy``."""
+        os.makedirs(directory, exist_ok=True)
+        config = {
+            "vocabulary": {term: int(col) for term, col in self.vocabulary.items()},
+            "ngram_range": list(self.ngram_range),
+            "stop_words": sorted(self.stop_words),
+            "sublinear_tf": bool(self.sublinear_tf),
+            "token_pattern": self.token_pattern,
+            "lowercase": bool(self.lowercase)
+        }
+        with open(os.path.join(directory, "config.json"), "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        np.save(os.path.join(directory, "idf.npy"), self.idf)
+
+    @classmethod
+    def load(cls, directory: str) -> "FrozenTfidf":
+        """Rebuild a transform written by :meth:`save`; needs no sklearn or pickle."""
+        with open(os.path.join(directory, "config.json"), "r", encoding="utf-8") as f:
+            config = json.load(f)
+        return cls(idf=np.load(os.path.join(directory, "idf.npy")), **config)
+
+    def _analyze(self, text: str) -> List[str]:
+        """Tokens and word n-grams, mirroring sklearn's word analyzer."""
+        tokens = self._tokenize(text.lower() if self.lowercase else text)
+        if self.stop_words:
+            tokens = [t for t in tokens if t not in self.stop_words]
+
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        grams = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            grams.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return grams
+
+    def transform(self, texts: Iterable[str]) -> csr_matrix:
+        """Vectorise ``texts`` into an L2-normalised float32 TF-IDF CSR matrix."""
+        data: List[np.ndarray] = []
+        indices: List[np.ndarray] = []
+        indptr = [0]
+        for text in texts:
+            counts = Counter(
+                col for col in map(self.vocabulary.get, self._analyze(text)) if col is not None
+            )
+            cols = np.fromiter(sorted(counts), dtype=np.int32, count=len(counts))
+            tf = np.fromiter((counts[c] for c in cols), dtype=np.float64, count=len(cols))
+            if self.sublinear_tf:
+                tf = np.log(tf) + 1.0
+            row = tf * self.idf[cols]
+            norm = np.sqrt(row @ row)
+            if norm > 0:
+                row /= norm
+            data.append(row.astype(np.float32))
+            indices.append(cols)
+            indptr.append(indptr[-1] + len(cols))
+
+        return csr_matrix(
+            (np.concatenate(data) if data else np.empty(0, dtype=np.float32),
+             np.concatenate(indices) if indices else np.empty(0, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int32)),
+            shape=(len(indptr) - 1, len(self.idf))
+        )
+
+
+def _row_dots(matrix: csr_matrix, rows: np.ndarray, vector: csr_matrix) -> np.ndarray:
+    """Dot products of a few CSR ``rows`` with a 1 x F sparse ``vector``.
+
+    Reads each row's slice of ``data``/``indices`` directly, which for a
+    handful of rows is much cheaper than fancy-indexing (or column-slicing a
+    transposed copy of) the whole matrix.
+    """
+    if not vector.nnz:
+        # Only the main field can be empty (no skills/aspirations/experience, or only
+        # unknown terms): the "industry:"/"location:" prefixes always yield a known token
+        return np.zeros(len(rows), dtype=np.float32)
+    dense = vector.toarray().ravel()
+    ptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+    return np.array(
+        [data[ptr[r]:ptr[r + 1]] @ dense[indices[ptr[r]:ptr[r + 1]]] for r in rows],
+        dtype=np.float32
+    )
+
+
+# Written last by export_artifacts(); its presence marks a complete artifact directory
+MANIFEST_FILENAME = "MANIFEST"
+
+
+class _CandidateKey(NamedTuple):
+    """The parts of a candidate that determine its recommendations, in hashable form."""
+    main: str
+    industry: str
+    location: str
+    skills: FrozenSet[str]
+    education_level: Any
+
+
+class _CandidateScores(NamedTuple):
+    """Ranked internship rows for one candidate with their read-only similarity scores."""
+    top_idx: np.ndarray
+    text_scores: np.ndarray
+    sim_main: np.ndarray
+    sim_industry: np.ndarray
+    sim_location: np.ndarray
 
 
 class InternshipRecommendationEngine:
@@ -22,19 +234,46 @@ class InternshipRecommendationEngine:
     - Confidence scoring for recommendations
     """
 
+    # Columns stored as pandas categoricals after load_data()
+    CATEGORICAL_COLUMNS = ["industry", "location", "company", "role_level", "company_size"]
+    RECOMMENDATION_CACHE_SIZE = 4096
+
     def __init__(self, weights: Optional[Dict[str, float]] = None) -> None:
         self.internships_df: Optional[pd.DataFrame] = None
+        self.total_internships = 0
+
+        # Scores for repeated candidate payloads are answered from here; cleared on
+        # every refit/load. Only immutable arrays are cached, records are built per call.
+        self._cached_scores = functools.lru_cache(
+            maxsize=self.RECOMMENDATION_CACHE_SIZE
+        )(self._score_one)
 
         # Enhanced vectorizers with better parameters
-        self.vec_main: Optional[TfidfVectorizer] = None
-        self.vec_industry: Optional[TfidfVectorizer] = None
-        self.vec_location: Optional[TfidfVectorizer] = None
+        self.vec_main: Optional["TfidfVectorizer"] = None
+        self.vec_industry: Optional["TfidfVectorizer"] = None
+        self.vec_location: Optional["TfidfVectorizer"] = None
 
         # Internship-side feature matrices
         self.intern_main = None
         self.intern_industry = None
         self.intern_location = None
 
+        # Plain-dict copy of each internship row, indexed by position at query time
+        self._internship_records: List[Dict[str, Any]] = []
+
+        # Parsed required skills per internship: (skill set, number of listed skills)
+        self._intern_skill_sets: List[Tuple[frozenset, int]] = []
+
+        # Lightweight transforms used for candidates at query time; these, not the
+        # sklearn vectorizers (only kept after fit()), are what artifacts persist
+        self._tfidf_main: Optional[FrozenTfidf] = None
+        self._tfidf_industry: Optional[FrozenTfidf] = None
+        self._tfidf_location: Optional[FrozenTfidf] = None
+
+        # Transposed weighted [main | industry | location] matrix (feature x
+        # internship), scored in one sparse product; memory-mapped when loaded
+        self.intern_all_T = None
+
         # Enhanced weights with more granular control
         if weights is None:
             weights = {
@@ -59,27 +298,26 @@ class InternshipRecommendationEngine:
             return ""
         
         # Convert to lowercase and remove extra whitespace
-        text = re.sub(r'\s+', ' ', str(text).lower().strip())
+        text = _WHITESPACE_RE.sub(' ', str(text).lower().strip())
         
         # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\+\#\-\.]', ' ', text)
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         
         # Normalize common skill variations
-        skill_mappings = {
-            'javascript': 'js', 'python programming': 'python',
-            'machine learning': 'ml', 'artificial intelligence': 'ai',
-            'data science': 'data analysis', 'web development': 'web dev'
-        }
-        
-        for original, normalized in skill_mappings.items():
+        for original, normalized in SKILL_MAPPINGS.items():
             text = text.replace(original, normalized)
         
         return text
 
+    def _preprocess_series(self, texts: pd.Series) -> pd.Series:
+        """``_preprocess_text`` over a column, evaluated once per distinct value."""
+        uniques = texts.unique()
+        return texts.map(dict(zip(uniques, map(self._preprocess_text, uniques))))
+
     def load_data(self, internships_csv_path: str) -> None:
         """Load and validate internship data with enhanced error handling."""
         try:
-            df = pd.read_csv(internships_csv_path)
+            df = pd.read_csv(internships_csv_path, engine="pyarrow")
             
             # Validate required columns
             expected = {"id", "company", "role", "location", "industry", "required_skills"}
@@ -90,35 +328,46 @@ class InternshipRecommendationEngine:
             # Enhanced data cleaning and preprocessing
             for col in ["company", "role", "location", "industry", "required_skills"]:
                 df[col] = df[col].fillna("").astype(str)
-                df[col] = df[col].apply(self._preprocess_text)
+                df[col] = self._preprocess_series(df[col])
 
             # Add derived columns for better matching
-            df['role_level'] = df['role'].apply(self._extract_role_level)
-            df['company_size'] = df['company'].apply(self._estimate_company_size)
+            df['role_level'] = self._extract_role_level(df['role'])
+            df['company_size'] = self._estimate_company_size(df['company'])
+
+            # Low-cardinality columns as categoricals: smaller frame, cheaper value_counts
+            for col in self.CATEGORICAL_COLUMNS:
+                df[col] = df[col].astype("category")
             
             self.internships_df = df
+            self.total_internships = len(df)
             print(f"✅ Loaded {len(df)} internships successfully")
             
         except Exception as e:
             raise RuntimeError(f"Failed to load internship data: {str(e)}")
 
-    def _extract_role_level(self, role: str) -> str:
-        """Extract role level from job title."""
-        role_lower = role.lower()
-        if any(word in role_lower for word in ['intern', 'trainee', 'entry', 'junior', 'associate']):
-            return 'entry'
-        elif any(word in role_lower for word in ['senior', 'lead', 'manager', 'head']):
-            return 'senior'
-        return 'mid'
+    def _extract_role_level(self, roles: pd.Series) -> np.ndarray:
+        """Extract role level from job titles."""
+        roles_lower = roles.str.lower()
+        return np.select(
+            [
+                roles_lower.str.contains(_keyword_pattern(['intern', 'trainee', 'entry', 'junior', 'associate'])),
+                roles_lower.str.contains(_keyword_pattern(['senior', 'lead', 'manager', 'head']))
+            ],
+            ['entry', 'senior'],
+            default='mid'
+        )
 
-    def _estimate_company_size(self, company: str) -> str:
+    def _estimate_company_size(self, companies: pd.Series) -> np.ndarray:
         """Estimate company size based on name patterns."""
-        company_lower = company.lower()
-        if any(word in company_lower for word in ['google', 'microsoft', 'amazon', 'apple', 'meta']):
-            return 'large'
-        elif any(word in company_lower for word in ['startup', 'tech', 'solutions', 'systems']):
-            return 'medium'
-        return 'small'
+        companies_lower = companies.str.lower()
+        return np.select(
+            [
+                companies_lower.str.contains(_keyword_pattern(['google', 'microsoft', 'amazon', 'apple', 'meta'])),
+                companies_lower.str.contains(_keyword_pattern(['startup', 'tech', 'solutions', 'systems']))
+            ],
+            ['large', 'medium'],
+            default='small'
+        )
 
     def _build_internship_corpora(self) -> Dict[str, List[str]]:
         """Build enhanced text corpora for different matching aspects."""
@@ -147,6 +396,8 @@ class InternshipRecommendationEngine:
         if self.internships_df is None:
             raise RuntimeError("Load internships data before fit().")
 
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         corpora = self._build_internship_corpora()
 
         # Enhanced vectorizers with better parameters
@@ -155,18 +406,21 @@ class InternshipRecommendationEngine:
             min_df=1, 
             max_df=0.95,
             stop_words='english',
-            sublinear_tf=True
+            sublinear_tf=True,
+            dtype=np.float32
         )
         
         self.vec_industry = TfidfVectorizer(
             ngram_range=(1, 2),
             min_df=1,
-            stop_words='english'
+            stop_words='english',
+            dtype=np.float32
         )
         
         self.vec_location = TfidfVectorizer(
             ngram_range=(1, 2),
-            min_df=1
+            min_df=1,
+            dtype=np.float32
         )
 
         try:
@@ -177,8 +431,57 @@ class InternshipRecommendationEngine:
         except Exception as e:
             raise RuntimeError(f"Failed to fit vectorizers: {str(e)}")
 
-    def _calculate_education_compatibility(self, candidate_education: str, internship_idx: int) -> float:
-        """Calculate education level compatibility score."""
+        self._tfidf_main = FrozenTfidf.from_vectorizer(self.vec_main)
+        self._tfidf_industry = FrozenTfidf.from_vectorizer(self.vec_industry)
+        self._tfidf_location = FrozenTfidf.from_vectorizer(self.vec_location)
+
+        # New matrices: drop any fused scoring matrix built from the old ones
+        self.intern_all_T = None
+        self._prepare_index()
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether candidate transforms are available, from fit() or loaded artifacts."""
+        return self._tfidf_main is not None
+
+    def _prepare_index(self) -> None:
+        """Derive query-time structures from the fitted internship matrices."""
+        self._cached_scores.cache_clear()
+
+        # Box every row once instead of going through pandas on each request
+        self._internship_records = self.internships_df.to_dict("records")
+
+        # Parse required skills once; requests only intersect sets
+        self._intern_skill_sets = [
+            (frozenset(skills), len(skills))
+            for skills in map(self._parse_skills, self.internships_df["required_skills"])
+        ]
+
+        # float32 halves memory and bandwidth of the sparse products; TF-IDF values
+        # lie in [0, 1] so single precision loses nothing that affects ranking.
+        self.intern_main = self.intern_main.astype(np.float32, copy=False)
+        self.intern_industry = self.intern_industry.astype(np.float32, copy=False)
+        self.intern_location = self.intern_location.astype(np.float32, copy=False)
+
+        # TfidfVectorizer L2-normalises every row, so the dot product of a candidate
+        # vector with an internship row already is their cosine similarity.
+        # Fold the field weights into the columns of one stacked matrix so a single
+        # product against the stacked candidate vector yields the weighted text score.
+        # Artifacts ship this matrix prebuilt, so loading processes map it instead
+        # of each building a private copy.
+        if self.intern_all_T is None:
+            self.intern_all_T = hstack([
+                self.weights["main"] * self.intern_main,
+                self.weights["industry"] * self.intern_industry,
+                self.weights["location"] * self.intern_location
+            ]).T.tocsr()
+
+    def _calculate_education_compatibility(self, candidate_education: str) -> float:
+        """Calculate education level compatibility score.
+
+        Every internship currently shares the same level range, so the score depends
+        only on the candidate and is applied to all internships as one scalar.
+        """
         candidate_level = self.education_hierarchy.get(candidate_education, 3)
         
         # For internships, we assume they're suitable for UG level and above
@@ -192,15 +495,19 @@ class InternshipRecommendationEngine:
         else:
             return 1.0  # Perfect match
 
-    def _analyze_skills_gap(self, candidate_skills: str, required_skills: str) -> Dict[str, Any]:
-        """Analyze skills gap and provide recommendations."""
-        candidate_skills_list = [s.strip().lower() for s in candidate_skills.split(',') if s.strip()]
-        required_skills_list = [s.strip().lower() for s in required_skills.split(',') if s.strip()]
+    @staticmethod
+    def _parse_skills(skills: str) -> List[str]:
+        """Split a comma-separated skills string into stripped, lowercased entries."""
+        return [s.strip().lower() for s in skills.split(',') if s.strip()]
+
+    def _analyze_skills_gap(self, candidate_skills: frozenset, idx: int) -> Dict[str, Any]:
+        """Analyze skills gap against internship ``idx`` and provide recommendations."""
+        required_skills, required_count = self._intern_skill_sets[idx]
         
-        matching_skills = set(candidate_skills_list) & set(required_skills_list)
-        missing_skills = set(required_skills_list) - set(candidate_skills_list)
+        matching_skills = candidate_skills & required_skills
+        missing_skills = required_skills - candidate_skills
         
-        match_percentage = len(matching_skills) / len(required_skills_list) if required_skills_list else 0
+        match_percentage = len(matching_skills) / required_count if required_count else 0
         
         return {
             'matching_skills': list(matching_skills),
@@ -237,91 +544,166 @@ class InternshipRecommendationEngine:
         
         return {"main": main_text, "industry": industry_text, "location": location_text}
 
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """Indices of the ``top_k`` highest scores, best first.
+
+        ``argpartition`` selects the top block in O(N); only those k entries are sorted.
+        """
+        k = min(top_k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        part = np.argpartition(-scores, k - 1)[:k]
+        return part[np.argsort(-scores[part], kind="stable")]
+
+    def _candidate_key(self, candidate: Dict[str, Any]) -> _CandidateKey:
+        """Normalise a candidate payload into the inputs the scoring actually uses.
+
+        Payloads that differ only in ways the model ignores (whitespace, case,
+        extra keys) map to the same key.
+        """
+        texts = self._candidate_texts(candidate)
+        return _CandidateKey(
+            main=texts["main"],
+            industry=texts["industry"],
+            location=texts["location"],
+            skills=frozenset(self._parse_skills(candidate.get("skills", ""))),
+            education_level=candidate.get("education_level", "")
+        )
+
+    def _transform_candidates(self, keys: List[_CandidateKey]) -> Tuple[csr_matrix, csr_matrix, csr_matrix]:
+        """TF-IDF vectors for the main, industry and location texts, one row per candidate."""
+        return (
+            self._tfidf_main.transform([key.main for key in keys]),
+            self._tfidf_industry.transform([key.industry for key in keys]),
+            self._tfidf_location.transform([key.location for key in keys])
+        )
+
+    def _build_recommendations(self, key: _CandidateKey, scores: _CandidateScores) -> List[Dict[str, Any]]:
+        """Assemble the scored, explained recommendation records for one candidate."""
+        top_idx, text_scores, sim_main, sim_industry, sim_location = scores
+
+        # Calculate education compatibility score (same for every internship)
+        education_score = self._calculate_education_compatibility(key.education_level)
+
+        # Weighted final scores for the selected rows
+        final_scores = text_scores + self.weights["education"] * education_score
+        recommendations = []
+
+        for rank, idx in enumerate(top_idx):
+            internship = self._internship_records[idx]
+            
+            # Enhanced scoring breakdown
+            skills_analysis = self._analyze_skills_gap(key.skills, idx)
+            
+            # Calculate confidence score
+            confidence = min(
+                (final_scores[rank] * 0.7 + skills_analysis['skills_confidence'] * 0.3) * 100,
+                95.0
+            )
+            
+            # Generate match reasoning
+            reasoning_parts = []
+            if sim_main[rank] > 0.3:
+                reasoning_parts.append(f"Strong skills match ({sim_main[rank]:.1%})")
+            if sim_industry[rank] > 0.5:
+                reasoning_parts.append(f"Industry alignment ({sim_industry[rank]:.1%})")
+            if sim_location[rank] > 0.7:
+                reasoning_parts.append("Location preference match")
+            if education_score > 0.8:
+                reasoning_parts.append("Education level compatible")
+            
+            match_reasoning = "; ".join(reasoning_parts) if reasoning_parts else "General compatibility"
+
+            recommendation = {
+                **internship,
+                'similarity': float(final_scores[rank]),
+                'confidence_score': round(confidence, 1),
+                'match_reasoning': match_reasoning,
+                'skills_analysis': skills_analysis,
+                'score_breakdown': {
+                    'skills_match': float(sim_main[rank]),
+                    'industry_match': float(sim_industry[rank]),
+                    'location_match': float(sim_location[rank]),
+                    'education_compatibility': float(education_score)
+                }
+            }
+            
+            recommendations.append(recommendation)
+
+        return recommendations
+
+    def _score(self, keys: List[_CandidateKey], top_k: int) -> List[_CandidateScores]:
+        """Score every candidate against all internships with one sparse product."""
+        cand_main, cand_industry, cand_location = self._transform_candidates(keys)
+
+        # Weighted text similarity for all candidates at once (unit-norm rows: dot product == cosine)
+        cand_all = hstack([cand_main, cand_industry, cand_location], format="csr")
+        scores = (cand_all @ self.intern_all_T).toarray()
+
+        if len(keys) == 1:
+            rows = [(cand_main, cand_industry, cand_location)]
+        else:
+            rows = ((cand_main[i], cand_industry[i], cand_location[i]) for i in range(len(keys)))
+
+        results = []
+        for i, (row_main, row_industry, row_location) in enumerate(rows):
+            # Education compatibility is the same for every internship, so the
+            # ranking only depends on text similarity
+            top_idx = self._top_k_indices(scores[i], top_k)
+            text_scores = scores[i, top_idx]
+            # Per-field similarities for the score breakdown, on the selected rows only
+            candidate_scores = _CandidateScores(
+                top_idx,
+                text_scores,
+                _row_dots(self.intern_main, top_idx, row_main),
+                _row_dots(self.intern_industry, top_idx, row_industry),
+                _row_dots(self.intern_location, top_idx, row_location)
+            )
+            for array in candidate_scores:
+                array.flags.writeable = False  # may be shared through the score cache
+            results.append(candidate_scores)
+        return results
+
+    def _score_one(self, key: _CandidateKey, top_k: int) -> _CandidateScores:
+        return self._score([key], top_k)[0]
+
     def get_recommendations(self, candidate: Dict[str, Any], top_k: int = 5) -> List[Dict[str, Any]]:
         """Get enhanced recommendations with detailed scoring and analysis."""
         if self.internships_df is None:
             return {"error": "Engine not initialized with internship data."}
         
-        if self.vec_main is None:
+        if not self.is_fitted:
             self.fit()
 
         try:
-            cand_texts = self._candidate_texts(candidate)
-
-            # Transform candidate into vectors
-            cand_main = self.vec_main.transform([cand_texts["main"]])
-            cand_industry = self.vec_industry.transform([cand_texts["industry"]])
-            cand_location = self.vec_location.transform([cand_texts["location"]])
-
-            # Calculate similarities
-            sim_main = cosine_similarity(cand_main, self.intern_main).ravel()
-            sim_industry = cosine_similarity(cand_industry, self.intern_industry).ravel()
-            sim_location = cosine_similarity(cand_location, self.intern_location).ravel()
-
-            # Calculate education compatibility scores
-            candidate_education = candidate.get("education_level", "")
-            education_scores = np.array([
-                self._calculate_education_compatibility(candidate_education, i) 
-                for i in range(len(self.internships_df))
-            ])
-
-            # Weighted final scores
-            final_scores = (
-                self.weights["main"] * sim_main +
-                self.weights["industry"] * sim_industry +
-                self.weights["location"] * sim_location +
-                self.weights["education"] * education_scores
-            )
+            key = self._candidate_key(candidate)
+            return self._build_recommendations(key, self._cached_scores(key, top_k))
 
-            # Get top recommendations
-            top_idx = np.argsort(final_scores)[::-1][:top_k]
-            recommendations = []
-
-            for idx in top_idx:
-                internship = self.internships_df.iloc[idx].to_dict()
-                
-                # Enhanced scoring breakdown
-                skills_analysis = self._analyze_skills_gap(
-                    candidate.get("skills", ""),
-                    internship["required_skills"]
-                )
-                
-                # Calculate confidence score
-                confidence = min(
-                    (final_scores[idx] * 0.7 + skills_analysis['skills_confidence'] * 0.3) * 100,
-                    95.0
-                )
-                
-                # Generate match reasoning
-                reasoning_parts = []
-                if sim_main[idx] > 0.3:
-                    reasoning_parts.append(f"Strong skills match ({sim_main[idx]:.1%})")
-                if sim_industry[idx] > 0.5:
-                    reasoning_parts.append(f"Industry alignment ({sim_industry[idx]:.1%})")
-                if sim_location[idx] > 0.7:
-                    reasoning_parts.append("Location preference match")
-                if education_scores[idx] > 0.8:
-                    reasoning_parts.append("Education level compatible")
-                
-                match_reasoning = "; ".join(reasoning_parts) if reasoning_parts else "General compatibility"
-
-                recommendation = {
-                    **internship,
-                    'similarity': float(final_scores[idx]),
-                    'confidence_score': round(confidence, 1),
-                    'match_reasoning': match_reasoning,
-                    'skills_analysis': skills_analysis,
-                    'score_breakdown': {
-                        'skills_match': float(sim_main[idx]),
-                        'industry_match': float(sim_industry[idx]),
-                        'location_match': float(sim_location[idx]),
-                        'education_compatibility': float(education_scores[idx])
-                    }
-                }
-                
-                recommendations.append(recommendation)
+        except Exception as e:
+            return {"error": f"Failed to generate recommendations: {str(e)}"}
 
-            return recommendations
+    def get_recommendations_batch(self, candidates: List[Dict[str, Any]],
+                                  top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Recommendations for many candidates, in input order.
+
+        Equivalent to calling ``get_recommendations`` per candidate, but all
+        candidates are vectorised together and scored with a single sparse
+        product, which is considerably faster for bulk or offline scoring.
+        """
+        if self.internships_df is None:
+            return {"error": "Engine not initialized with internship data."}
+
+        if not self.is_fitted:
+            self.fit()
+
+        if not candidates:
+            return []
+
+        try:
+            keys = [self._candidate_key(c) for c in candidates]
+            return [self._build_recommendations(key, scores)
+                    for key, scores in zip(keys, self._score(keys, top_k))]
 
         except Exception as e:
             return {"error": f"Failed to generate recommendations: {str(e)}"}
@@ -329,29 +711,38 @@ class InternshipRecommendationEngine:
     # Enhanced artifact management
     def export_artifacts(self, output_dir: str) -> Dict[str, str]:
         """Export model artifacts with enhanced metadata."""
+        import joblib  # deferred: only artifact export/load pays its import cost
         os.makedirs(output_dir, exist_ok=True)
         paths = {}
         
-        # Define all paths
-        artifact_files = [
-            "vec_main", "vec_industry", "vec_location",
-            "intern_main", "intern_industry", "intern_location",
-            "internships_df"
-        ]
+        # Define all paths: the dataframe goes through joblib, vectorizers are
+        # saved as JSON + idf arrays, and sparse matrices as raw CSR arrays (one
+        # directory each) so they can be memory-mapped
+        artifact_files = ["internships_df"]
+        vectorizer_dirs = {"vec_main": "_tfidf_main", "vec_industry": "_tfidf_industry",
+                           "vec_location": "_tfidf_location"}
+        matrix_files = ["intern_main", "intern_industry", "intern_location", "intern_all_T"]
         
         for artifact in artifact_files:
             paths[artifact] = os.path.join(output_dir, f"{artifact}.joblib")
+        for name in [*vectorizer_dirs, *matrix_files]:
+            paths[name] = os.path.join(output_dir, name)
         
         paths["weights_json"] = os.path.join(output_dir, "weights.json")
         paths["metadata_json"] = os.path.join(output_dir, "metadata.json")
+        paths["manifest"] = os.path.join(output_dir, MANIFEST_FILENAME)
 
         # Ensure fitted
-        if any(getattr(self, attr) is None for attr in ["vec_main", "vec_industry", "vec_location"]):
+        if not self.is_fitted:
             self.fit()
 
         # Save artifacts
         for artifact in artifact_files:
             joblib.dump(getattr(self, artifact), paths[artifact])
+        for name, attr in vectorizer_dirs.items():
+            getattr(self, attr).save(paths[name])
+        for matrix in matrix_files:
+            _save_csr(paths[matrix], getattr(self, matrix))
 
         # Save configuration and metadata
         with open(paths["weights_json"], "w", encoding="utf-8") as f:
@@ -371,19 +762,26 @@ class InternshipRecommendationEngine:
         with open(paths["metadata_json"], "w", encoding="utf-8") as f:
             json.dump(metadata, f, indent=2)
 
+        # Mark the export complete only after every other file is written
+        with open(paths["manifest"], "w", encoding="utf-8") as f:
+            f.write("\n".join(os.path.basename(p) for k, p in paths.items() if k != "manifest") + "\n")
+
         return paths
 
     def load_artifacts(self, input_dir: str) -> None:
         """Load artifacts with validation."""
+        import joblib
         try:
             # Load vectorizers and matrices
-            self.vec_main = joblib.load(os.path.join(input_dir, "vec_main.joblib"))
-            self.vec_industry = joblib.load(os.path.join(input_dir, "vec_industry.joblib"))
-            self.vec_location = joblib.load(os.path.join(input_dir, "vec_location.joblib"))
-            self.intern_main = joblib.load(os.path.join(input_dir, "intern_main.joblib"))
-            self.intern_industry = joblib.load(os.path.join(input_dir, "intern_industry.joblib"))
-            self.intern_location = joblib.load(os.path.join(input_dir, "intern_location.joblib"))
+            self._tfidf_main = FrozenTfidf.load(os.path.join(input_dir, "vec_main"))
+            self._tfidf_industry = FrozenTfidf.load(os.path.join(input_dir, "vec_industry"))
+            self._tfidf_location = FrozenTfidf.load(os.path.join(input_dir, "vec_location"))
+            self.intern_main = _load_csr(os.path.join(input_dir, "intern_main"))
+            self.intern_industry = _load_csr(os.path.join(input_dir, "intern_industry"))
+            self.intern_location = _load_csr(os.path.join(input_dir, "intern_location"))
+            self.intern_all_T = _load_csr(os.path.join(input_dir, "intern_all_T"))
             self.internships_df = joblib.load(os.path.join(input_dir, "internships_df.joblib"))
+            self.total_internships = len(self.internships_df)
             
             # Load weights
             weights_path = os.path.join(input_dir, "weights.json")
@@ -391,6 +789,8 @@ class InternshipRecommendationEngine:
                 with open(weights_path, "r", encoding="utf-8") as f:
                     self.weights = json.load(f)
             
+            self._prepare_index()
+            
             print("✅ Artifacts loaded successfully")
             
         except Exception as e: